@@ -9,30 +9,52 @@ Features implemented
 * Settings dialog to edit table/board name and price per hour
 * Membership pricing with configurable discount (default 100% off)
 * Data persisted to JSON on shutdown and re-loaded on next start
+* Finished sessions appended to a per-table JSON-lines log as they end
 
-The code uses **PySide6**. Install with:
+The code uses **PySide6** and needs Python 3.10 or newer. Install with:
     pip install PySide6
 
+Installing **orjson** as well speeds up saving and loading; the standard
+library json module is used when it is not available.
+
 Run with:
     python billiards_manager.py
 """
 from __future__ import annotations
 
 import json
+import os
 import sys
-from dataclasses import dataclass, field, asdict
+import time
+import uuid
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import List
-
-from PySide6.QtCore import QDateTime, QTimer, Qt
+from typing import Iterable, List
+
+try:
+    import orjson
+except ImportError:  # optional, fall back to the stdlib encoder
+    orjson = None
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDateTime,
+    QModelIndex,
+    QRunnable,
+    QStringListModel,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import QAction, QPixmap, QPainter, QFont
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QPushButton,
@@ -48,15 +70,226 @@ from PySide6.QtWidgets import (
     QComboBox,
     QGridLayout,
     QScrollArea,
+    QTableView,
 )
 
 DATA_FILE = Path("tables.json")
+SESSIONS_DIR = Path("sessions")  # one <table uid>.jsonl session log per table
+# Version 2: tables.json is {"schema_version", "tables"} and every stored
+# session has all Session fields. Version 1 files are a bare list of tables.
+SCHEMA_VERSION = 2
+# Values for session fields missing from version 1 files, by member flag
+_SESSION_DEFAULTS = {"players": 2, "member_players": 0, "paying_players": 2}
+_MEMBER_SESSION_DEFAULTS = {"players": 2, "member_players": 2, "paying_players": 0}
 MEMBER_DISCOUNT = 0.20  # 20 % off the hourly rate  
 SINGLE_PLAYER_MULTIPLIER = 0.5  # 50% discount for single player
 TABLE_TYPES = ["Billiard", "Snooker", "Darts"]
+# (name, price per hour, type) of the tables created when there is no data file
+DEFAULT_TABLES = (
+    ("Table 1", 10.0, "Billiard"),
+    ("Table 2", 10.0, "Snooker"),
+    ("Table 3", 10.0, "Darts"),
+)
+# tables.json is written compact; set SALOON_DEBUG to get indented output
+_PRETTY_JSON = bool(os.environ.get("SALOON_DEBUG"))
+
+# Font for placeholder card images; created on first use since QFont needs
+# a running QApplication
+_PLACEHOLDER_FONT: QFont | None = None
+
+# One table-type list shared by every type combo box, so opening the
+# settings dialog doesn't marshal the strings into Qt again
+_TABLE_TYPES_MODEL: QStringListModel | None = None
+
+
+def _table_types_model() -> QStringListModel:
+    global _TABLE_TYPES_MODEL
+    if _TABLE_TYPES_MODEL is None:
+        _TABLE_TYPES_MODEL = QStringListModel(TABLE_TYPES)
+    return _TABLE_TYPES_MODEL
+
+
+# Built once: json.dumps() with any non-default option constructs a new
+# JSONEncoder on every call
+_ORJSON_OPTION = 0 if orjson is None or not _PRETTY_JSON else orjson.OPT_INDENT_2
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_FILE_ENCODER = json.JSONEncoder(indent=2) if _PRETTY_JSON else _COMPACT_ENCODER
+
+
+def _dump_json(data) -> bytes:
+    """Encode *data* as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=_ORJSON_OPTION)
+    return _FILE_ENCODER.encode(data).encode("utf-8")
+
+
+def _dump_json_line(data) -> bytes:
+    """Encode *data* as one compact, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return _COMPACT_ENCODER.encode(data).encode("utf-8") + b"\n"
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_suffix(path.suffix + ".tmp")
+
+
+def _write_atomic(path: Path, raw: bytes):
+    """Replace *path* with *raw* so an interrupted write never truncates it"""
+    tmp = _tmp_path(path)
+    tmp.write_bytes(raw)
+    os.replace(tmp, path)
+
+
+def _load_json(raw: bytes):
+    """Decode UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=8192)
+def _fmt_hms(seconds: int) -> str:
+    """Format a duration as HH:MM:SS; cached since the clock revisits the same values"""
+    mins, sec = divmod(seconds, 60)
+    hrs, mins = divmod(mins, 60)
+    return f"{hrs:02d}:{mins:02d}:{sec:02d}"
+
+
+# Application-wide stylesheet for the table cards. Qt parses it once and
+# matches it against every card through type and object-name selectors,
+# instead of parsing a separate copy per widget.
+GLOBAL_QSS = """
+    TableWidget {
+        background-color: #ffffff;
+        border: 2px solid #d1d5db;
+        border-radius: 12px;
+        margin: 5px;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    TableWidget:hover {
+        border: 2px solid #3b82f6;
+        box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15);
+        background-color: #ffffff;
+        transform: translateY(-2px);
+    }
+    TableWidget QLabel#tableImage {
+        border: 2px solid #e5e7eb;
+        border-radius: 8px;
+        background-color: #f9fafb;
+        padding: 4px;
+    }
+    TableWidget QLabel#tableImage:hover {
+        border: 2px solid #3b82f6;
+        background-color: #eff6ff;
+    }
+    TableWidget QLabel#tableImage[active="true"] {
+        border: 3px solid #3b82f6;
+        background-color: #dbeafe;
+        box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.1);
+    }
+    TableWidget QLabel#tableImage[active="true"]:hover {
+        border: 3px solid #2563eb;
+        background-color: #bfdbfe;
+    }
+    TableWidget QLabel#tableName {
+        font-weight: bold;
+        font-size: 16px;
+        color: #2c3e50;
+        background-color: transparent;
+        padding: 4px;
+        margin: 2px 0px;
+        border: none;
+    }
+    TableWidget QLabel#memberBadge {
+        font-weight: bold;
+        font-size: 11px;
+        color: #ffffff;
+        background-color: #28a745;
+        padding: 4px 8px;
+        border-radius: 6px;
+        margin: 2px 0px;
+    }
+    TableWidget QLabel#clock {
+        font-size: 18px;
+        font-weight: bold;
+        color: #495057;
+        background-color: #e9ecef;
+        border: 1px solid #ced4da;
+        border-radius: 6px;
+        padding: 6px;
+        margin: 2px 0px;
+    }
+    QWidget#controls QPushButton {
+        background-color: #007bff;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 14px;
+        font-weight: bold;
+        font-size: 12px;
+        min-height: 32px;
+        margin: 2px;
+    }
+    QWidget#controls QPushButton:hover {
+        background-color: #0056b3;
+    }
+    QWidget#controls QPushButton:pressed {
+        background-color: #004085;
+    }
+    QWidget#controls QPushButton:disabled {
+        background-color: #6c757d;
+        color: #dee2e6;
+    }
+    QWidget#controls QPushButton#start { background-color: #28a745; }
+    QWidget#controls QPushButton#start:hover { background-color: #1e7e34; }
+    QWidget#controls QPushButton#pause { background-color: #ffc107; color: #212529; }
+    QWidget#controls QPushButton#pause:hover { background-color: #e0a800; }
+    QWidget#controls QPushButton#resume { background-color: #17a2b8; }
+    QWidget#controls QPushButton#resume:hover { background-color: #117a8b; }
+    QWidget#controls QPushButton#stop { background-color: #dc3545; }
+    QWidget#controls QPushButton#stop:hover { background-color: #c82333; }
+    QWidget#controls QPushButton#history,
+    QWidget#controls QPushButton#settings { background-color: #6c757d; }
+    QWidget#controls QPushButton#history:hover,
+    QWidget#controls QPushButton#settings:hover { background-color: #5a6268; }
+"""
+
+# Stylesheets for widgets outside the table cards
+_TOOLBAR_QSS = """
+    QToolBar {
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        padding: 8px;
+        spacing: 8px;
+    }
+    QToolBar QToolButton {
+        background-color: #007bff;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 10px 20px;
+        font-weight: bold;
+        font-size: 14px;
+        min-width: 100px;
+        margin: 2px;
+    }
+    QToolBar QToolButton:hover {
+        background-color: #0056b3;
+        transform: translateY(-1px);
+    }
+    QToolBar QToolButton:pressed {
+        background-color: #004085;
+        transform: translateY(0px);
+    }
+"""
+_TOTAL_QSS = "font-weight: bold; color: #2c3e50;"
+_INFO_QSS = "color: #666; font-size: 10px;"
+_PRICING_QSS = "color: #666;"
+_DELETE_QSS = "background-color: #e74c3c; color: white; font-weight: bold;"
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     start: str
     end: str
@@ -66,62 +299,175 @@ class Session:
     players: int = 2  # Default to 2 players for backward compatibility
     member_players: int = 0  # Number of member players
     paying_players: int = 2  # Number of non-member (paying) players
+    # History dialog cells, formatted on first use (see display)
+    _display: tuple[str, ...] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Persisted field names, fixed once so serialization skips fields() lookups
+    _FIELDS = (
+        "start", "end", "seconds", "price", "member",
+        "players", "member_players", "paying_players",
+    )
+
+    def _as_plain_dict(self) -> dict:
+        return {n: getattr(self, n) for n in self._FIELDS}
 
     @property
     def duration_str(self) -> str:
-        mins, sec = divmod(self.seconds, 60)
-        hrs, mins = divmod(mins, 60)
-        return f"{hrs:02d}:{mins:02d}:{sec:02d}"
+        return _fmt_hms(self.seconds)
+
+    @property
+    def player_text(self) -> str:
+        total_players = self.member_players + self.paying_players
+        if self.member_players > 0 and self.paying_players > 0:
+            return f"{total_players}P ({self.member_players}M+{self.paying_players}$)"
+        elif self.member_players > 0:
+            return f"{total_players}P (all M)"
+        return f"{total_players}P (all $)"
+
+    @property
+    def price_text(self) -> str:
+        if self.price == 0:
+            return "Free"
+        if self.paying_players == 1:
+            return f"€{self.price:.2f} total"
+        if self.paying_players > 1:
+            total_amount = self.price * self.paying_players
+            return f"€{self.price:.2f}/player (€{total_amount:.2f} total)"
+        # Single total price
+        return f"€{self.price:.2f}"
+
+    @property
+    def display(self) -> tuple[str, ...]:
+        """History dialog cells, formatted once so reopening the dialog is a lookup"""
+        if self._display is None:
+            self._display = (self.start, self.end, self.duration_str, self.player_text, self.price_text)
+        return self._display
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     name: str
     price_per_hour: float
     table_type: str = "Billiard"  # Default to Billiard
-    history: List[Session] = field(default_factory=list)
-    start_time: QDateTime | None = None
+    start_time: float | None = None  # time.monotonic() of the last start/resume
     paused_seconds: int = 0
     paused: bool = False
     current_players: int = 2  # Current session total player count
     current_member_players: int = 0  # Current session member player count
     current_paying_players: int = 2  # Current session paying player count
+    uid: str = field(default_factory=lambda: uuid.uuid4().hex)  # names the session log
+    # Finished sessions; None until first read from the session log (see history)
+    _history: List[Session] | None = field(default=None, init=False, repr=False, compare=False)
+    # Last to_json() result; cleared by update_settings()
+    _cached_json: dict | None = field(default=None, init=False, repr=False, compare=False)
+    # True while history read from an older tables.json has no session log yet
+    log_pending: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Fields persisted in tables.json; history lives in the session log and
+    # the remaining fields (start_time, paused*, current_*) are runtime only.
+    _FIELDS = ("uid", "name", "price_per_hour", "table_type")
+
+    def _as_plain_dict(self) -> dict:
+        return {n: getattr(self, n) for n in self._FIELDS}
 
     def to_json(self):
-        d = asdict(self)
-        d["history"] = [asdict(s) for s in self.history]
-        d.pop("start_time")  # not serialisable
-        d.pop("current_players")  # runtime only
-        d.pop("current_member_players")  # runtime only
-        d.pop("current_paying_players")  # runtime only
-        return d
+        # Persisted fields only change through update_settings(), so the dict
+        # is built once and shared by later saves; callers must not mutate it
+        if self._cached_json is None:
+            self._cached_json = self._as_plain_dict()
+        return self._cached_json
+
+    def update_settings(self, name: str, price_per_hour: float, table_type: str):
+        self.name = name
+        self.price_per_hour = price_per_hour
+        self.table_type = table_type
+        self._cached_json = None
+
+    @property
+    def history(self) -> List[Session]:
+        """Finished sessions, read from the session log on first access"""
+        if self._history is None:
+            try:
+                self._history = [Session(**s) for s in self._read_log()]
+            except FileNotFoundError:
+                self._history = []  # no session has finished yet
+        return self._history
+
+    @history.setter
+    def history(self, sessions: List[Session]):
+        self._history = sessions
+
+    @property
+    def log_path(self) -> Path:
+        return SESSIONS_DIR / f"{self.uid}.jsonl"
+
+    def append_to_log(self, session: Session):
+        """Append one finished session to this table's session log"""
+        if self.log_pending:
+            self.write_log()  # the history still has to be written out in full
+            return
+        SESSIONS_DIR.mkdir(exist_ok=True)
+        with self.log_path.open("a+b") as f:
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Close a line cut off by an interrupted append, so this
+                    # record isn't glued onto it and dropped with it on load
+                    f.write(b"\n")
+            f.write(_dump_json_line(session._as_plain_dict()))
+
+    def write_log(self):
+        """Rewrite this table's session log from the in-memory history"""
+        SESSIONS_DIR.mkdir(exist_ok=True)
+        _write_atomic(self.log_path, b"".join(_dump_json_line(s._as_plain_dict()) for s in self.history))
+        self.log_pending = False
+
+    def _read_log(self) -> List[dict]:
+        sessions = []
+        with self.log_path.open("rb") as f:
+            for line in f:
+                try:
+                    sessions.append(_load_json(line))
+                except ValueError:
+                    pass  # blank or truncated line left by an interrupted append
+        return sessions
 
     @classmethod
-    def from_json(cls, d):
-        history = []
-        for s in d.get("history", []):
-            # Handle backward compatibility for sessions without new fields
-            session_data = s.copy()
-            if "players" not in session_data:
-                session_data["players"] = 2
-            if "member_players" not in session_data:
-                session_data["member_players"] = 2 if session_data.get("member", False) else 0
-            if "paying_players" not in session_data:
-                session_data["paying_players"] = 0 if session_data.get("member", False) else 2
-            history.append(Session(**session_data))
-        return cls(
+    def from_json(cls, d, schema_version: int = SCHEMA_VERSION):
+        table = cls(
             name=d["name"], 
             price_per_hour=d["price_per_hour"], 
             table_type=d.get("table_type", "Billiard"),  # Default to Billiard for backward compatibility
-            history=history
         )
+        if "uid" in d:
+            table.uid = d["uid"]
+        if schema_version >= 2:
+            return table  # history is read from the session log when first needed
+        # Older files keep the history inline instead of in a session log
+        table.history = [cls._session_from_json(s) for s in d.get("history", [])]
+        table.log_pending = True
+        return table
+
+    @staticmethod
+    def _session_from_json(s) -> Session:
+        # Handle backward compatibility for sessions without new fields
+        defaults = _MEMBER_SESSION_DEFAULTS if s.get("member", False) else _SESSION_DEFAULTS
+        return Session(**{**defaults, **s})
 
     def is_running(self) -> bool:
         return self.start_time is not None and not self.paused
 
+    def elapsed_seconds(self, now: float | None = None) -> int:
+        """Seconds played in the current session as of the monotonic time *now*"""
+        if self.start_time is None:
+            return self.paused_seconds
+        if now is None:
+            now = time.monotonic()
+        return self.paused_seconds + int(now - self.start_time)
+
     def start(self, member_players: int = 0, paying_players: int = 2):
         if self.start_time is None:
-            self.start_time = QDateTime.currentDateTime()
+            self.start_time = time.monotonic()
             self.paused_seconds = 0
             self.paused = False
             self.current_players = member_players + paying_players
@@ -129,25 +475,22 @@ class Table:
             self.current_paying_players = paying_players
 
     def pause(self):
-        if self.start_time and not self.paused:
-            now = QDateTime.currentDateTime()
-            self.paused_seconds += self.start_time.secsTo(now)
+        if self.start_time is not None and not self.paused:
+            self.paused_seconds = self.elapsed_seconds()
             self.start_time = None
             self.paused = True
 
     def resume(self):
         if self.paused:
-            self.start_time = QDateTime.currentDateTime()
+            self.start_time = time.monotonic()
             self.paused = False
 
     def stop(self) -> Session:
-        if not self.start_time and not self.paused:
+        if self.start_time is None and not self.paused:
             raise RuntimeError("Timer not running")
+        # Wall-clock time is only needed for the persisted start/end strings
         end_time = QDateTime.currentDateTime()
-        if self.paused:
-            total_secs = self.paused_seconds
-        else:
-            total_secs = self.paused_seconds + self.start_time.secsTo(end_time)
+        total_secs = self.elapsed_seconds()
 
         # Calculate price based on paying players count
         if self.current_paying_players == 0:
@@ -162,7 +505,7 @@ class Table:
                 price = total_cost / self.current_paying_players
 
         session = Session(
-            start=(self.start_time or end_time).addSecs(-total_secs).toString(Qt.ISODate),
+            start=end_time.addSecs(-total_secs).toString(Qt.ISODate),
             end=end_time.toString(Qt.ISODate),
             seconds=total_secs,
             price=round(price, 2),
@@ -181,35 +524,47 @@ class Table:
         return session
 
 
+class HistoryModel(QAbstractTableModel):
+    """Read-only model over a table's history; Qt only asks for the visible rows"""
+
+    HEADERS = ("Start", "End", "Duration", "Players", "Price")
+
+    def __init__(self, table: Table, parent=None):
+        super().__init__(parent)
+        self._history = table.history
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._history)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._history[index.row()].display[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
 class TableWidget(QWidget):
+    # Emitted when the table's settings change; sessions go to the session log
+    changed = Signal()
+
+    # Scaled card images shared by every widget, keyed by table type
+    _PIXMAP_CACHE: dict[str, QPixmap] = {}
+
     def __init__(self, table: Table, parent=None):
         super().__init__(parent)
         self.table = table
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self.update_clock)
         self.controls_visible = False
 
         # Set fixed size for the widget
         self.setFixedSize(200, 430)  # Increased height from 320 to 360 for even more button space
         
-        # Apply card-like styling to the widget
-        self.setStyleSheet("""
-            TableWidget {
-                background-color: #ffffff;
-                border: 2px solid #d1d5db;
-                border-radius: 12px;
-                margin: 5px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            }
-            TableWidget:hover {
-                border: 2px solid #3b82f6;
-                box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15);
-                background-color: #ffffff;
-                transform: translateY(-2px);
-            }
-        """)
-        
         # Main layout
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
@@ -220,18 +575,7 @@ class TableWidget(QWidget):
         self.image_label.setFixedSize(176, 120)
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.raise_()  # Ensure image stays on top
-        self.image_label.setStyleSheet("""
-            QLabel {
-                border: 2px solid #e5e7eb;
-                border-radius: 8px;
-                background-color: #f9fafb;
-                padding: 4px;
-            }
-            QLabel:hover {
-                border: 2px solid #3b82f6;
-                background-color: #eff6ff;
-            }
-        """)
+        self.image_label.setObjectName("tableImage")
         self.image_label.mousePressEvent = self.toggle_controls
         self.load_table_image()
         layout.addWidget(self.image_label)
@@ -239,78 +583,25 @@ class TableWidget(QWidget):
         # Table name
         self.name_lbl = QLabel(table.name)
         self.name_lbl.setAlignment(Qt.AlignCenter)
-        self.name_lbl.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 16px;
-                color: #2c3e50;
-                background-color: transparent;
-                padding: 4px;
-                margin: 2px 0px;
-                border: none;
-            }
-        """)
+        self.name_lbl.setObjectName("tableName")
         layout.addWidget(self.name_lbl)
 
         # Member status label (initially hidden)
         self.member_lbl = QLabel("MEMBER - FREE PLAY")
         self.member_lbl.setAlignment(Qt.AlignCenter)
-        self.member_lbl.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                font-size: 11px;
-                color: #ffffff;
-                background-color: #28a745;
-                padding: 4px 8px;
-                border-radius: 6px;
-                margin: 2px 0px;
-            }
-        """)
+        self.member_lbl.setObjectName("memberBadge")
         self.member_lbl.hide()  # Initially hidden
         layout.addWidget(self.member_lbl)
 
         # Clock display
         self.clock_lbl = QLabel("00:00:00")
         self.clock_lbl.setAlignment(Qt.AlignCenter)
-        self.clock_lbl.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: bold;
-                color: #495057;
-                background-color: #e9ecef;
-                border: 1px solid #ced4da;
-                border-radius: 6px;
-                padding: 6px;
-                margin: 2px 0px;
-            }
-        """)
+        self.clock_lbl.setObjectName("clock")
         layout.addWidget(self.clock_lbl)
 
         # Controls container (initially hidden)
         self.controls_widget = QWidget()
-        self.controls_widget.setStyleSheet("""
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 14px;
-                font-weight: bold;
-                font-size: 12px;
-                min-height: 32px;
-                margin: 2px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-                color: #dee2e6;
-            }
-        """)
+        self.controls_widget.setObjectName("controls")
         controls_layout = QVBoxLayout(self.controls_widget)
         controls_layout.setContentsMargins(0, 0, 0, 0)
 
@@ -320,19 +611,19 @@ class TableWidget(QWidget):
         btn_layout.setContentsMargins(4, 4, 4, 4)  # Add margins around the grid
         
         self.start_btn = QPushButton("Start")
-        self.start_btn.setStyleSheet("QPushButton { background-color: #28a745; } QPushButton:hover { background-color: #1e7e34; }")
+        self.start_btn.setObjectName("start")
         self.start_btn.clicked.connect(self.start_timer)
         
         self.pause_btn = QPushButton("Pause")
-        self.pause_btn.setStyleSheet("QPushButton { background-color: #ffc107; color: #212529; } QPushButton:hover { background-color: #e0a800; }")
+        self.pause_btn.setObjectName("pause")
         self.pause_btn.clicked.connect(self.pause_timer)
         
         self.resume_btn = QPushButton("Resume")
-        self.resume_btn.setStyleSheet("QPushButton { background-color: #17a2b8; } QPushButton:hover { background-color: #117a8b; }")
+        self.resume_btn.setObjectName("resume")
         self.resume_btn.clicked.connect(self.resume_timer)
         
         self.stop_btn = QPushButton("Stop")
-        self.stop_btn.setStyleSheet("QPushButton { background-color: #dc3545; } QPushButton:hover { background-color: #c82333; }")
+        self.stop_btn.setObjectName("stop")
         self.stop_btn.clicked.connect(self.stop_timer)
         
         btn_layout.addWidget(self.start_btn, 0, 0)
@@ -349,11 +640,11 @@ class TableWidget(QWidget):
         bottom_layout = QHBoxLayout()
         bottom_layout.setSpacing(6)  # Add spacing between history and settings buttons
         self.hist_btn = QPushButton("History")
-        self.hist_btn.setStyleSheet("QPushButton { background-color: #6c757d; } QPushButton:hover { background-color: #5a6268; }")
+        self.hist_btn.setObjectName("history")
         self.hist_btn.clicked.connect(self.show_history)
         
         self.set_btn = QPushButton("Settings")
-        self.set_btn.setStyleSheet("QPushButton { background-color: #6c757d; } QPushButton:hover { background-color: #5a6268; }")
+        self.set_btn.setObjectName("settings")
         self.set_btn.clicked.connect(self.show_settings)
         
         bottom_layout.addWidget(self.hist_btn)
@@ -369,7 +660,6 @@ class TableWidget(QWidget):
         self.update_button_states()
         
         if self.table.is_running():
-            self.timer.start()
             self.update_clock()
             # Show member label if current session has member players
             if self.table.current_member_players > 0:
@@ -381,39 +671,25 @@ class TableWidget(QWidget):
     def toggle_controls(self, event):
         """Toggle visibility of control buttons when image is clicked"""
         self.controls_visible = not self.controls_visible
-        if self.controls_visible:
-            self.controls_widget.show()
-            self.image_label.setStyleSheet("""
-                QLabel {
-                    border: 3px solid #3b82f6;
-                    border-radius: 8px;
-                    background-color: #dbeafe;
-                    padding: 4px;
-                    box-shadow: 0 0 0 1px rgba(59, 130, 246, 0.1);
-                }
-                QLabel:hover {
-                    border: 3px solid #2563eb;
-                    background-color: #bfdbfe;
-                }
-            """)
-        else:
-            self.controls_widget.hide()
-            self.image_label.setStyleSheet("""
-                QLabel {
-                    border: 2px solid #e5e7eb;
-                    border-radius: 8px;
-                    background-color: #f9fafb;
-                    padding: 4px;
-                }
-                QLabel:hover {
-                    border: 2px solid #3b82f6;
-                    background-color: #eff6ff;
-                }
-            """)
+        self.controls_widget.setVisible(self.controls_visible)
+        # Highlight the image through the [active="true"] rules of GLOBAL_QSS
+        self.image_label.setProperty("active", self.controls_visible)
+        self.image_label.style().unpolish(self.image_label)
+        self.image_label.style().polish(self.image_label)
 
     def load_table_image(self):
         """Load the appropriate image for the table type, or create a placeholder"""
-        image_path = f"graphics/{self.table.table_type.lower()}.png"
+        table_type = self.table.table_type
+        pixmap = self._PIXMAP_CACHE.get(table_type)
+        if pixmap is None:
+            pixmap = self._render_table_image(table_type)
+            self._PIXMAP_CACHE[table_type] = pixmap
+        self.image_label.setPixmap(pixmap)
+
+    @staticmethod
+    def _render_table_image(table_type: str) -> QPixmap:
+        global _PLACEHOLDER_FONT
+        image_path = f"graphics/{table_type.lower()}.png"
         pixmap = QPixmap(image_path)
         
         if pixmap.isNull():
@@ -424,14 +700,16 @@ class TableWidget(QWidget):
             # Draw placeholder text
             painter = QPainter(pixmap)
             painter.setPen(Qt.black)
-            painter.setFont(QFont("Arial", 12, QFont.Bold))
-            painter.drawText(pixmap.rect(), Qt.AlignCenter, self.table.table_type)
+            if _PLACEHOLDER_FONT is None:
+                _PLACEHOLDER_FONT = QFont("Arial", 12, QFont.Bold)
+            painter.setFont(_PLACEHOLDER_FONT)
+            painter.drawText(pixmap.rect(), Qt.AlignCenter, table_type)
             painter.end()
         else:
             # Scale the image to fit
             pixmap = pixmap.scaled(180, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
         
-        self.image_label.setPixmap(pixmap)
+        return pixmap
 
     def update_button_states(self):
         """Update button enabled/disabled states based on table status"""
@@ -449,7 +727,6 @@ class TableWidget(QWidget):
         member_players, paying_players = self.ask_player_info()
         if member_players is not None:  # User didn't cancel
             self.table.start(member_players, paying_players)
-            self.timer.start()
             self.update_button_states()
             
             # Show/hide member status
@@ -464,17 +741,18 @@ class TableWidget(QWidget):
 
     def pause_timer(self):
         self.table.pause()
-        self.timer.stop()
         self.update_button_states()
 
     def resume_timer(self):
         self.table.resume()
-        self.timer.start()
         self.update_button_states()
 
     def stop_timer(self):
         session = self.table.stop()
-        self.timer.stop()
+        try:
+            self.table.append_to_log(session)
+        except OSError as exc:
+            QMessageBox.critical(self, "Error", f"Failed to record session: {exc}")
         self.clock_lbl.setText("00:00:00")
         self.member_lbl.hide()  # Hide member label when session ends
         self.update_button_states()
@@ -531,7 +809,7 @@ class TableWidget(QWidget):
         
         # Total player display
         total_label = QLabel("Total: 2 players")
-        total_label.setStyleSheet("font-weight: bold; color: #2c3e50;")
+        total_label.setStyleSheet(_TOTAL_QSS)
         form.addRow("", total_label)
         
         def update_total():
@@ -549,7 +827,7 @@ class TableWidget(QWidget):
             f"• 1 paying player: {int(SINGLE_PLAYER_MULTIPLIER * 100)}% of total cost\n"
             f"• 2+ paying players: Total cost divided equally"
         )
-        info_label.setStyleSheet("color: #666; font-size: 10px;")
+        info_label.setStyleSheet(_INFO_QSS)
         form.addRow(info_label)
         
         # Buttons
@@ -575,54 +853,22 @@ class TableWidget(QWidget):
             return None, None  # User cancelled
 
     def update_clock(self):
-        if self.table.start_time:
-            elapsed = self.table.start_time.secsTo(QDateTime.currentDateTime()) + self.table.paused_seconds
-        else:
-            elapsed = self.table.paused_seconds
-        mins, sec = divmod(elapsed, 60)
-        hrs, mins = divmod(mins, 60)
-        self.clock_lbl.setText(f"{hrs:02d}:{mins:02d}:{sec:02d}")
+        self.update_clock_with(time.monotonic())
+
+    def update_clock_with(self, now: float):
+        """Show the elapsed time as of the monotonic time *now*; driven by MainWindow's shared tick"""
+        self.clock_lbl.setText(_fmt_hms(self.table.elapsed_seconds(now)))
 
     def show_history(self):
         dlg = QDialog(self)
         dlg.setWindowTitle(f"History — {self.table.name}")
         vbox = QVBoxLayout(dlg)
-        listw = QListWidget()
-        for s in self.table.history:
-            # Handle both old and new session formats
-            if hasattr(s, 'member_players') and hasattr(s, 'paying_players'):
-                total_players = s.member_players + s.paying_players
-                if s.member_players > 0 and s.paying_players > 0:
-                    player_text = f"{total_players}P ({s.member_players}M+{s.paying_players}$)"
-                elif s.member_players > 0:
-                    player_text = f"{total_players}P (all M)"
-                else:
-                    player_text = f"{total_players}P (all $)"
-            else:
-                # Old format fallback
-                player_text = f"{s.players}P" if hasattr(s, 'players') else "2P"
-                if s.member:
-                    player_text += " (M)"
-            
-            if s.price == 0:
-                price_text = "Free"
-            else:
-                # Calculate and show total amount
-                if hasattr(s, 'paying_players') and s.paying_players > 0:
-                    total_amount = s.price * s.paying_players
-                    if s.paying_players == 1:
-                        price_text = f"€{s.price:.2f} total"
-                    else:
-                        price_text = f"€{s.price:.2f}/player (€{total_amount:.2f} total)"
-                else:
-                    # Old format or single total price
-                    price_text = f"€{s.price:.2f}"
-                
-            item = QListWidgetItem(
-                f"{s.start} → {s.end}  |  {s.duration_str}  |  {player_text}  |  {price_text}"
-            )
-            listw.addItem(item)
-        vbox.addWidget(listw)
+        view = QTableView()
+        view.setModel(HistoryModel(self.table, view))
+        view.verticalHeader().hide()
+        view.horizontalHeader().setStretchLastSection(True)
+        view.setSelectionBehavior(QTableView.SelectRows)
+        vbox.addWidget(view)
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(dlg.accept)
         vbox.addWidget(close_btn)
@@ -643,7 +889,7 @@ class TableWidget(QWidget):
         
         # Table type selection
         type_combo = QComboBox()
-        type_combo.addItems(TABLE_TYPES)
+        type_combo.setModel(_table_types_model())
         type_combo.setCurrentText(self.table.table_type)
         
         form.addRow("Name", name_edit)
@@ -656,14 +902,14 @@ class TableWidget(QWidget):
             f"• 1 paying player: {int(SINGLE_PLAYER_MULTIPLIER*100)}% of total cost\n"
             f"• 2+ paying players: Total cost divided equally"
         )
-        member_discount_lbl.setStyleSheet("color: #666;")
+        member_discount_lbl.setStyleSheet(_PRICING_QSS)
         form.addRow(member_discount_lbl)
         
         btn_box = QHBoxLayout()
         ok_btn = QPushButton("OK")
         cancel_btn = QPushButton("Cancel")
         delete_btn = QPushButton("Delete Table")
-        delete_btn.setStyleSheet("background-color: #e74c3c; color: white; font-weight: bold;")
+        delete_btn.setStyleSheet(_DELETE_QSS)
         
         btn_box.addWidget(ok_btn)
         btn_box.addWidget(cancel_btn)
@@ -690,15 +936,18 @@ class TableWidget(QWidget):
 
         result = dlg.exec()
         if result == 1:  # OK button (accept)
-            self.table.name = name_edit.text() or self.table.name
-            self.table.price_per_hour = rate_spin.value()
             old_type = self.table.table_type
-            self.table.table_type = type_combo.currentText()
+            self.table.update_settings(
+                name=name_edit.text() or self.table.name,
+                price_per_hour=rate_spin.value(),
+                table_type=type_combo.currentText(),
+            )
             
             # Update UI
             self.name_lbl.setText(self.table.name)
             if old_type != self.table.table_type:
                 self.load_table_image()  # Reload image if type changed
+            self.changed.emit()
         elif result == 2:  # Delete button
             # Find parent MainWindow and remove this table
             parent_window = self.parent()
@@ -709,42 +958,60 @@ class TableWidget(QWidget):
                 parent_window.delete_table(self.table)
 
 
+class _AddTableDialog(QDialog):
+    """The "New table" dialog; MainWindow builds it once and resets it per use"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("New table")
+        form = QFormLayout(self)
+        
+        self.name_edit = QLineEdit()
+        
+        self.rate_spin = QDoubleSpinBox()
+        self.rate_spin.setRange(0.0, 100.0)
+        self.rate_spin.setSuffix(" €/h")
+        
+        # Table type selection
+        self.type_combo = QComboBox()
+        self.type_combo.setModel(_table_types_model())
+        
+        form.addRow("Name", self.name_edit)
+        form.addRow("Rate", self.rate_spin)
+        form.addRow("Table Type", self.type_combo)
+        
+        btn_box = QHBoxLayout()
+        ok_btn = QPushButton("Add")
+        cancel_btn = QPushButton("Cancel")
+        btn_box.addWidget(ok_btn)
+        btn_box.addWidget(cancel_btn)
+        form.addRow(btn_box)
+
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+
+
 class MainWindow(QMainWindow):
-    def __init__(self, tables: List[Table]):
+    def __init__(self, tables: List[Table], saved: bool = True):
         super().__init__()
         self.setWindowTitle("Billiards Manager")
-        self.tables = tables
+        self.tables = {table.uid: table for table in tables}  # insertion-ordered
+        # Unsaved changes since the last load/save. Tables that tables.json
+        # doesn't list yet start dirty, so their uids (and with them their
+        # session logs) are saved on close at the latest.
+        self._dirty = not saved
+        # Table cards keyed by table uid, reused across refresh_ui() calls
+        self._widget_for: dict[str, TableWidget] = {}
+        self._refresh_pending = False
+        self._add_dialog: _AddTableDialog | None = None  # built on first use by add_table
+        self._save_task: _SaveTask | None = None  # started by closeEvent
+        # Session logs of deleted tables, removed once tables.json no longer lists them
+        self._deleted_logs: List[Path] = []
         
 
 
         tb = QToolBar()
-        tb.setStyleSheet("""
-            QToolBar {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                padding: 8px;
-                spacing: 8px;
-            }
-            QToolBar QToolButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 14px;
-                min-width: 100px;
-                margin: 2px;
-            }
-            QToolBar QToolButton:hover {
-                background-color: #0056b3;
-                transform: translateY(-1px);
-            }
-            QToolBar QToolButton:pressed {
-                background-color: #004085;
-                transform: translateY(0px);
-            }
-        """)
+        tb.setStyleSheet(_TOOLBAR_QSS)
         self.addToolBar(tb)
         
         add_act = QAction("➕ Add Table", self)
@@ -767,107 +1034,273 @@ class MainWindow(QMainWindow):
         self.grid_layout.setSpacing(20)  # More spacing between cards
         self.scroll_area.setWidget(self.scroll_widget)
         self.main_layout.addWidget(self.scroll_area)
+        # Created up front so the first save message doesn't shift the layout
+        self.statusBar()
         
         self.refresh_ui()
 
+        # One shared clock tick for all cards instead of a QTimer per card
+        self._tick = QTimer(self)
+        self._tick.setInterval(1000)
+        self._tick.timeout.connect(self._tick_all)
+        self._tick.start()
+
+    def _tick_all(self):
+        now = time.monotonic()
+        for table_widget in self._widget_for.values():
+            if table_widget.table.is_running():
+                table_widget.update_clock_with(now)
+
+    def _schedule_refresh(self):
+        """Coalesce refresh requests into one refresh_ui() on the next event loop pass"""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.refresh_ui()
+
     def refresh_ui(self):
-        # Clear existing widgets
-        while self.grid_layout.count():
-            child = self.grid_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Add tables in a grid layout (3 columns)
-        columns = 3
-        for i, table in enumerate(self.tables):
-            row = i // columns
-            col = i % columns
-            table_widget = TableWidget(table)
-            self.grid_layout.addWidget(table_widget, row, col)
-        
-        # Add stretch to push everything to the top
-        self.grid_layout.setRowStretch(len(self.tables) // columns + 1, 1)
+        # Freeze repaints so the grid is laid out once, not after every addWidget
+        self.scroll_widget.setUpdatesEnabled(False)
+        try:
+            # Detach every card from the grid; the widgets themselves are kept
+            while self.grid_layout.count():
+                self.grid_layout.takeAt(0)
 
-    def add_table(self):
-        dlg = QDialog(self)
-        dlg.setWindowTitle("New table")
-        form = QFormLayout(dlg)
+            # Only destroy the cards whose table has been deleted
+            for key in [key for key in self._widget_for if key not in self.tables]:
+                self._widget_for.pop(key).deleteLater()
         
-        name_edit = QLineEdit()
+            # Add tables in a grid layout (3 columns), creating cards for new tables only
+            columns = 3
+            for i, table in enumerate(self.tables.values()):
+                row = i // columns
+                col = i % columns
+                table_widget = self._widget_for.get(table.uid)
+                if table_widget is None:
+                    table_widget = TableWidget(table)
+                    table_widget.changed.connect(self._mark_dirty)
+                    self._widget_for[table.uid] = table_widget
+                self.grid_layout.addWidget(table_widget, row, col)
         
-        rate_spin = QDoubleSpinBox()
-        rate_spin.setRange(0.0, 100.0)
-        rate_spin.setSuffix(" €/h")
-        rate_spin.setValue(10.0)
-        
-        # Table type selection
-        type_combo = QComboBox()
-        type_combo.addItems(TABLE_TYPES)
-        type_combo.setCurrentText("Billiard")  # Default selection
-        
-        form.addRow("Name", name_edit)
-        form.addRow("Rate", rate_spin)
-        form.addRow("Table Type", type_combo)
-        
-        btn_box = QHBoxLayout()
-        ok_btn = QPushButton("Add")
-        cancel_btn = QPushButton("Cancel")
-        btn_box.addWidget(ok_btn)
-        btn_box.addWidget(cancel_btn)
-        form.addRow(btn_box)
+            # Add stretch to push everything to the top
+            self.grid_layout.setRowStretch(len(self.tables) // columns + 1, 1)
+        finally:
+            self.scroll_widget.setUpdatesEnabled(True)
+            self.scroll_widget.updateGeometry()
 
-        ok_btn.clicked.connect(dlg.accept)
-        cancel_btn.clicked.connect(dlg.reject)
+    def add_table(self):
+        # The dialog is built once and reset on every open
+        if self._add_dialog is None:
+            self._add_dialog = _AddTableDialog(self)
+        dlg = self._add_dialog
+        dlg.name_edit.clear()
+        dlg.rate_spin.setValue(10.0)
+        dlg.type_combo.setCurrentText("Billiard")  # Default selection
 
         if dlg.exec():
             table = Table(
-                name=name_edit.text() or "Table", 
-                price_per_hour=rate_spin.value(),
-                table_type=type_combo.currentText()
+                name=dlg.name_edit.text() or "Table", 
+                price_per_hour=dlg.rate_spin.value(),
+                table_type=dlg.type_combo.currentText()
             )
-            self.tables.append(table)
-            self.refresh_ui()
+            self.add_tables([table])
+
+    def add_tables(self, new_tables: Iterable[Table]):
+        """Add several tables at once with a single grid refresh"""
+        self.tables.update((table.uid, table) for table in new_tables)
+        self._dirty = True
+        self._schedule_refresh()
 
     def delete_table(self, table_to_delete: Table):
         """Delete a table from the list and refresh the UI"""
-        if table_to_delete in self.tables:
-            self.tables.remove(table_to_delete)
-            self.refresh_ui()
+        if self.tables.pop(table_to_delete.uid, None) is not None:
+            self._deleted_logs.append(table_to_delete.log_path)
+            self._dirty = True
+            self._schedule_refresh()
             QMessageBox.information(self, "Table Deleted", f"Table '{table_to_delete.name}' has been deleted.")
 
+    def _mark_dirty(self):
+        self._dirty = True
+
     def closeEvent(self, e):
-        self.save_data()
+        if self._dirty:
+            # Snapshot the tables here; encoding and writing happen on a pool
+            # thread so the window closes without waiting for the disk
+            pending = [t for t in self.tables.values() if t.log_pending]
+            self._save_task = _SaveTask(
+                _tables_document(self.tables.values()), pending, self._deleted_logs
+            )
+            QThreadPool.globalInstance().start(self._save_task)
+            self._dirty = False
         super().closeEvent(e)
 
     def save_data(self):
+        if not self._dirty:
+            # Nothing changed since the file was last read or written
+            self.statusBar().showMessage("Data saved successfully.", 2000)
+            return
         try:
-            data = [t.to_json() for t in self.tables]
-            DATA_FILE.write_text(json.dumps(data, indent=2))
-            QMessageBox.information(self, "Saved", "Data saved successfully.")
+            _write_pending_logs(self.tables.values())
+            _write_atomic(DATA_FILE, _encode_tables(self.tables.values()))
+            self._dirty = False
+            self.statusBar().showMessage("Data saved successfully.", 2000)
         except Exception as exc:
             QMessageBox.critical(self, "Error", f"Failed to save: {exc}")
+        else:
+            _remove_logs(self._deleted_logs)
+            self._deleted_logs = []
 
 
-def load_tables() -> List[Table]:
-    if DATA_FILE.exists():
+class _SaveTask(QRunnable):
+    """Encode a tables.json document and write it atomically, off the GUI thread"""
+
+    def __init__(self, document: dict, pending: List[Table], deleted_logs: List[Path]):
+        super().__init__()
+        self.document = document
+        self.pending = pending  # tables whose session log must be written first
+        self.deleted_logs = deleted_logs  # removed once the document is written
+        self.error: Exception | None = None  # reported by main() once the pool is done
+        self.setAutoDelete(False)  # main() reads error after the task has run
+
+    def run(self):
+        try:
+            _write_pending_logs(self.pending)
+            _write_atomic(DATA_FILE, _dump_tables_document(self.document))
+        except Exception as exc:
+            self.error = exc
+        else:
+            _remove_logs(self.deleted_logs)
+
+
+def _tables_document(tables: Iterable[Table]) -> dict:
+    """Build the current-version tables.json document for *tables*"""
+    return {"schema_version": SCHEMA_VERSION, "tables": [t.to_json() for t in tables]}
+
+
+def _encode_tables(tables: Iterable[Table]) -> bytes:
+    """Serialize *tables* as a current-version tables.json document"""
+    return _dump_tables_document(_tables_document(tables))
+
+
+def _encode_float(value) -> str:
+    return repr(float(value))
+
+
+def _table_field_encoders() -> tuple:
+    """(name, '"name":' prefix, value encoder) for each of Table._FIELDS, in order"""
+    # Chosen by the field's annotated type; a persisted field of any other
+    # type raises KeyError at import instead of being dropped on save
+    by_type = {"str": encode_basestring_ascii, "float": _encode_float}  # string annotations
+    types = {f.name: f.type for f in fields(Table)}
+    return tuple(
+        (name, encode_basestring_ascii(name) + ":", by_type[types[name]])
+        for name in Table._FIELDS
+    )
+
+
+_TABLE_FIELD_ENCODERS = _table_field_encoders()
+
+
+def _dump_tables_document(document: dict) -> bytes:
+    """Encode a tables.json document, with a fixed-shape path for the stdlib fallback"""
+    if orjson is not None or _PRETTY_JSON:
+        return _dump_json(document)
+    # The generic stdlib encoder type-dispatches on every value. The shape is
+    # known from Table._FIELDS, so each value goes straight to its encoder
+    # and the whole document is a single join.
+    tables = ",".join(
+        "{" + ",".join(prefix + encode(t[name]) for name, prefix, encode in _TABLE_FIELD_ENCODERS) + "}"
+        for t in document["tables"]
+    )
+    return f'{{"schema_version":{document["schema_version"]},"tables":[{tables}]}}'.encode("ascii")
+
+
+def _recover_pending_save():
+    """Finish a save that was cut off between writing the temp file and renaming it"""
+    tmp = _tmp_path(DATA_FILE)
+    try:
+        raw = tmp.read_bytes()
+    except OSError:
+        return  # usually no leftover; an unreadable one is left for the user
+    try:
+        _load_json(raw)  # only a completely written file parses
+        os.replace(tmp, DATA_FILE)
+    except Exception:
         try:
-            data = json.loads(DATA_FILE.read_text())
-            return [Table.from_json(d) for d in data]
-        except Exception:
+            tmp.unlink(missing_ok=True)
+        except OSError:
             pass
-    return [
-        Table("Table 1", 10.0, "Billiard"), 
-        Table("Table 2", 10.0, "Snooker"),
-        Table("Table 3", 10.0, "Darts")
-    ]
+
+
+def load_tables() -> tuple[List[Table], bool]:
+    """Read tables.json; the flag is False when the tables aren't saved there yet"""
+    _recover_pending_save()
+    # A single open instead of exists() followed by a read
+    try:
+        raw = DATA_FILE.read_bytes()
+    except OSError:
+        return _default_tables(), False
+    try:
+        data = _load_json(raw)
+        if isinstance(data, dict):
+            version, entries = data["schema_version"], data["tables"]
+        else:
+            version, entries = 1, data
+        tables = [Table.from_json(d, version) for d in entries]
+    except Exception:
+        return _default_tables(), False
+    if version < SCHEMA_VERSION:
+        return tables, _migrate_history(tables)
+    return tables, True
+
+
+def _default_tables() -> List[Table]:
+    return [Table(*spec) for spec in DEFAULT_TABLES]
+
+
+def _write_pending_logs(tables: Iterable[Table]):
+    """Write the session logs still owed by tables read from an older tables.json"""
+    # Must run before any tables.json that refers to these logs is written
+    for table in tables:
+        if table.log_pending:
+            table.write_log()
+
+
+def _remove_logs(paths: Iterable[Path]):
+    """Delete the session logs of tables a saved tables.json no longer lists"""
+    for path in paths:
+        try:
+            path.unlink(missing_ok=True)
+        except OSError:
+            pass  # a leftover log is never read again
+
+
+def _migrate_history(tables: List[Table]) -> bool:
+    """Upgrade an older tables.json, moving inline history into session logs"""
+    try:
+        _write_pending_logs(tables)
+        _write_atomic(DATA_FILE, _encode_tables(tables))
+    except OSError:
+        # The new uids aren't on disk; the window starts dirty so the next
+        # save retries, writing any remaining logs first
+        return False
+    return True
 
 
 def main():
     app = QApplication(sys.argv)
-    mw = MainWindow(load_tables())
+    app.setStyleSheet(GLOBAL_QSS)
+    mw = MainWindow(*load_tables())
     mw.resize(1050, 700)  # Smaller size since controls are hidden by default
     mw.show()
-    sys.exit(app.exec())
+    status = app.exec()
+    QThreadPool.globalInstance().waitForDone()  # let the save from closeEvent finish
+    if mw._save_task is not None and mw._save_task.error is not None:
+        QMessageBox.critical(None, "Error", f"Failed to save: {mw._save_task.error}")
+    sys.exit(status)
 
 
 if __name__ == "__main__":